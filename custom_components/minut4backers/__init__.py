@@ -13,8 +13,11 @@ import logging
 from datetime import timedelta
 from typing import Any
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import (
@@ -22,9 +25,9 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
-from .api import MinutAPI
+from .api import MinutAPI, Tokens, create_session
 from .const import DOMAIN, PLATFORMS, SCAN_INTERVAL
-from .coordinator import MinutDataUpdateCoordinator
+from .coordinator import MinutConfigEntry, MinutDataUpdateCoordinator, MinutRuntimeData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,20 +38,34 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     return True
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Minut from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the keep-alive session shared by all entries and the config flow."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session: aiohttp.ClientSession | None = domain_data.get("session")
+    if session is None or session.closed:
+        session = domain_data["session"] = create_session()
+
+        async def _close_session(event: Event) -> None:
+            await session.close()
 
-    session = hass.helpers.aiohttp_client.async_get_clientsession()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _close_session)
+    return session
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: MinutConfigEntry) -> bool:
+    """Set up Minut from a config entry."""
+    session = async_get_session(hass)
 
     # Read stored credentials
     user_id: str = entry.data.get("user_id")
     access_token: str = entry.data.get("access_token")
     refresh_token: str | None = entry.data.get("refresh_token")
 
-    api = MinutAPI(session, user_id=user_id, access_token=access_token, refresh_token=refresh_token)
+    api = MinutAPI(session)
+    tokens = Tokens(access_token=access_token, refresh_token=refresh_token, user_id=user_id)
 
-    coordinator = MinutDataUpdateCoordinator(hass, api, SCAN_INTERVAL)
+    coordinator = MinutDataUpdateCoordinator(hass, entry, api, tokens, SCAN_INTERVAL)
 
     try:
         await coordinator.async_config_entry_first_refresh()
@@ -56,18 +73,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady("Error communicating with Minut API") from err
 
     # Store coordinator for platforms to access
-    hass.data[DOMAIN][entry.entry_id] = {
-        "coordinator": coordinator,
-        "api": api,
-    }
+    entry.runtime_data = MinutRuntimeData(coordinator=coordinator, api=api)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: MinutConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-    return unload_ok
\ No newline at end of file
+        still_loaded = any(
+            other.entry_id != entry.entry_id and other.state is ConfigEntryState.LOADED
+            for other in hass.config_entries.async_entries(DOMAIN)
+        )
+        if not still_loaded and "session" in hass.data.get(DOMAIN, {}):
+            # Last entry gone; release the pooled connections
+            await hass.data[DOMAIN].pop("session").close()
+    return unload_ok
@@ -1,24 +1,68 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import json
+import logging
+import math
+import random
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
 
 import aiohttp
+import orjson
 from aiohttp import ClientResponseError
 
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
 BASE_URL = "https://api.minut.com"
 OAUTH_TOKEN_URL = f"{BASE_URL}/v1/oauth/token"
 # These are the “web dashboard” style endpoints that work without official API access:
 DRAFT_DEVICES_URL = f"{BASE_URL}/draft1/devices"
-DRAFT_DEVICE_TIMELINE_URL = f"{BASE_URL}/draft1/device/{{device_id}}/timeline"
+# Small authenticated resource, used to check tokens without listing devices
+DRAFT_USER_URL = f"{BASE_URL}/draft1/users/{{user_id}}"
+# Account-wide timeline: events for every device in a single call
+DRAFT_TIMELINE_URL = f"{BASE_URL}/draft1/timelines/me"
 # Best-effort “latest” reads; if any of these 404 we’ll fall back to timeline-only
 DRAFT_TEMP_VALUES_URL = f"{BASE_URL}/draft1/device/{{device_id}}/temperature/values?limit=1"
 DRAFT_HUMID_VALUES_URL = f"{BASE_URL}/draft1/device/{{device_id}}/humidity/values?limit=1"
 DRAFT_SOUND_AVG_URL = f"{BASE_URL}/draft1/device/{{device_id}}/sound/avg_levels?limit=1"
 
-DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=20)
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5, sock_read=10)
+# Refresh the access token this many seconds before it actually expires
+TOKEN_REFRESH_MARGIN = 300
+# Assumed lifetime when the token server doesn't tell us (and it isn't a JWT)
+DEFAULT_TOKEN_LIFETIME = 3600
+# Transient failures (429, 5xx, dropped connections) are retried with jittered
+# exponential backoff: 0.5s, 1s, 2s ... capped at RETRY_MAX_DELAY
+RETRY_ATTEMPTS = 4
+RETRY_START_DELAY = 0.5
+RETRY_MAX_DELAY = 10.0
+# Client-side pacing so a concurrent poll doesn't trip Minut's rate limit
+RATE_LIMIT_REQUESTS = 30
+RATE_LIMIT_WINDOW = 10.0
+
+def create_session() -> aiohttp.ClientSession:
+    """
+    Build a session dedicated to Minut calls.
+    Every poll hits the same host many times, so keep connections alive,
+    cache DNS and size the pool per host to avoid repeated TCP/TLS handshakes.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=10,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=DEFAULT_TIMEOUT)
 
 @dataclass
 class Tokens:
@@ -32,24 +76,183 @@ class MinutAuthError(Exception):
 class MinutRateLimitError(Exception):
     """429 Too Many Requests."""
 
+    def __init__(self, *args: Any, retry_after: Optional[float] = None) -> None:
+        super().__init__(*args)
+        # Seconds the server asked us to wait (Retry-After), if it said so
+        self.retry_after = retry_after
+
 class MinutConnectError(Exception):
     """Network/downstream problems (timeouts, DNS, 5xx)."""
 
+def _retry_after(resp: aiohttp.ClientResponse) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+async def _raise_for_status(resp: aiohttp.ClientResponse) -> None:
+    """`resp.raise_for_status()`, reading the error body only when debug logging is on."""
+    if resp.status >= 400 and _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Minut API %s %s failed with HTTP %s: %s",
+            resp.method, resp.url.path, resp.status, await resp.text(),
+        )
+    resp.raise_for_status()
+
+def _value_urls(device_id: str) -> Tuple[str, str, str]:
+    """Temperature, humidity and sound URLs for a device (built once per device list)."""
+    return (
+        DRAFT_TEMP_VALUES_URL.format(device_id=device_id),
+        DRAFT_HUMID_VALUES_URL.format(device_id=device_id),
+        DRAFT_SOUND_AVG_URL.format(device_id=device_id),
+    )
+
+def _as_float(v: Any) -> Optional[float]:
+    """JSON numbers are used as-is; only strings and the like are coerced."""
+    if isinstance(v, (int, float)):
+        return v
+    return float(v) if v is not None else None
+
+async def _read_json(resp: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON body with orjson, straight from the raw bytes."""
+    # Skips aiohttp's bytes -> str decode; orjson parses bytes directly
+    body = await resp.read()
+    return orjson.loads(body) if body.strip() else None
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """Return the `exp` claim (epoch seconds) of a JWT, or None if unavailable."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+@lru_cache(maxsize=256)
+def _parse_minut_ts(s: str) -> datetime:
+    """
+    Parse Minut's `YYYY-MM-DDTHH:MM:SS[.fff]Z` timestamps by slicing.
+    Consecutive polls see the same timestamps, hence the cache. Anything
+    else goes through `datetime.fromisoformat` (raises ValueError).
+    """
+    if s[-1:] == "Z" and s[19:20] in ("Z", "."):
+        try:
+            micro = int((s[20:-1] + "000000")[:6]) if s[19] == "." else 0
+            return datetime(
+                int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                int(s[11:13]), int(s[14:16]), int(s[17:19]), micro,
+                tzinfo=timezone.utc,
+            )
+        except (IndexError, ValueError):
+            pass
+    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+
+def _event_time(ev: Dict[str, Any]) -> Optional[datetime]:
+    """Parse an event's (or sample's) timestamp; naive values are taken as UTC."""
+    ts = ev.get("timestamp") or ev.get("time") or ev.get("created_at") or ev.get("datetime")
+    try:
+        when = _parse_minut_ts(str(ts))
+    except ValueError:
+        return None
+    # Aware datetimes compare correctly across offsets, no need to convert
+    return when if when.tzinfo is not None else when.replace(tzinfo=timezone.utc)
+
+def _recent_events(js: Any, cutoff: datetime) -> List[Dict[str, Any]]:
+    """Events from a decoded timeline body that happened at or after `cutoff`."""
+    events = js if isinstance(js, list) else js.get("events", [])
+    if len(events) > 1:
+        # The timeline is newest-first; guard against an oldest-first response
+        first, last = _event_time(events[0]), _event_time(events[-1])
+        if first is not None and last is not None and first < last:
+            events = events[::-1]
+
+    recent: List[Dict[str, Any]] = []
+    for ev in events:
+        when = _event_time(ev)
+        if when is None:
+            continue
+        if when < cutoff:
+            # Everything after this is older still
+            break
+        recent.append(ev)
+    return recent
+
+class AdaptiveRateLimiter:
+    """
+    Sliding-window limiter: at most `rate` requests per `window_seconds`.
+    The rate halves on every 429 and grows back by one after
+    `recovery_successes` successful requests, up to `max_requests_per_window`.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_window: int = RATE_LIMIT_REQUESTS,
+        window_seconds: float = RATE_LIMIT_WINDOW,
+        min_requests_per_window: int = 2,
+        recovery_successes: int = 20,
+    ) -> None:
+        self._max_rate = max_requests_per_window
+        self._min_rate = min_requests_per_window
+        self._window = window_seconds
+        self._recovery_successes = recovery_successes
+        self._rate = max_requests_per_window
+        self._successes = 0
+        self._sent: Deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent (callers queue up in order)."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= self._window:
+                    self._sent.popleft()
+                if len(self._sent) < self._rate:
+                    self._sent.append(now)
+                    return
+                await asyncio.sleep(self._window - (now - self._sent[0]))
+
+    def queue_time(self, requests: int) -> float:
+        """Upper bound on how long `requests` more requests wait at the current rate."""
+        return math.ceil(requests / self._rate) * self._window if requests > 0 else 0.0
+
+    def record_rate_limit(self) -> None:
+        self._rate = max(self._min_rate, self._rate // 2)
+        self._successes = 0
+        _LOGGER.debug("Minut rate limit hit; pacing to %s requests/%ss", self._rate, self._window)
+
+    def record_success(self) -> None:
+        if self._rate >= self._max_rate:
+            return
+        self._successes += 1
+        if self._successes >= self._recovery_successes:
+            self._rate += 1
+            self._successes = 0
+
 class MinutAPI:
     def __init__(self, session: aiohttp.ClientSession) -> None:
         self._session = session
+        # Monotonic deadline for proactively refreshing `_expires_token`
+        self._expires_at: float = 0
+        self._expires_token: Optional[str] = None
+        self._refresh_lock = asyncio.Lock()
+        self._limiter = AdaptiveRateLimiter()
+        # Sample ordering of the values endpoints, detected on first use
+        self._values_newest_first: Optional[bool] = None
+        self._hdr_cache: Optional[Tuple[str, Dict[str, str]]] = None
+        # device_id -> (temperature, humidity, sound) "latest value" URLs
+        self._value_urls: Dict[str, Tuple[str, str, str]] = {}
 
-    async def password_login(self, username: str, password: str) -> Tokens:
-        """
-        Emulates the dashboard password grant:
-        POST /v1/oauth/token  (x-www-form-urlencoded)
-        grant_type=password&username=...&password=...
-        """
-        data = {
-            "grant_type": "password",
-            "username": username,
-            "password": password,
-        }
+    async def _token_request(self, data: Dict[str, str]) -> Dict[str, Any]:
+        """POST /v1/oauth/token (x-www-form-urlencoded) and return the JSON body."""
         try:
             async with self._session.post(
                 OAUTH_TOKEN_URL,
@@ -60,8 +263,8 @@ class MinutAPI:
                     raise MinutAuthError("invalid_auth")
                 if resp.status == 429:
                     raise MinutRateLimitError("rate_limited")
-                resp.raise_for_status()
-                js = await resp.json()
+                await _raise_for_status(resp)
+                return await _read_json(resp)
         except ClientResponseError as e:
             if 500 <= e.status < 600:
                 raise MinutConnectError("server_error") from e
@@ -69,120 +272,283 @@ class MinutAPI:
         except (asyncio.TimeoutError, aiohttp.ClientError) as e:
             raise MinutConnectError("cannot_connect") from e
 
-        return Tokens(
+    def _set_expiry(self, tokens: Tokens, expires_in: Optional[float] = None) -> None:
+        """
+        Remember when `tokens.access_token` should be refreshed.
+        Uses `expires_in` from the token response if given, else the JWT `exp` claim.
+        """
+        if expires_in is None:
+            exp = _jwt_expiry(tokens.access_token)
+            expires_in = exp - time.time() if exp is not None else DEFAULT_TOKEN_LIFETIME
+        self._expires_at = time.monotonic() + float(expires_in) - TOKEN_REFRESH_MARGIN
+        self._expires_token = tokens.access_token
+
+    async def _refresh_access_token(self, tokens: Tokens) -> None:
+        """Exchange the refresh token for a new access token, updating `tokens` in place."""
+        js = await self._token_request(
+            {"grant_type": "refresh_token", "refresh_token": tokens.refresh_token or ""}
+        )
+        tokens.access_token = js.get("access_token", "")
+        tokens.refresh_token = js.get("refresh_token") or tokens.refresh_token
+        self._set_expiry(tokens, js.get("expires_in"))
+
+    async def _ensure_token(self, tokens: Tokens) -> None:
+        """
+        Refresh the access token shortly before it expires instead of waiting
+        for a 401. Concurrent callers share a single refresh.
+        """
+        if self._expires_token != tokens.access_token:
+            self._set_expiry(tokens)
+        if time.monotonic() < self._expires_at or not tokens.refresh_token:
+            return
+        async with self._refresh_lock:
+            # Another request may have refreshed while we waited for the lock
+            if self._expires_token == tokens.access_token and time.monotonic() < self._expires_at:
+                return
+            await self._refresh_access_token(tokens)
+
+    async def password_login(self, username: str, password: str) -> Tokens:
+        """
+        Emulates the dashboard password grant:
+        POST /v1/oauth/token  (x-www-form-urlencoded)
+        grant_type=password&username=...&password=...
+        """
+        data = {
+            "grant_type": "password",
+            "username": username,
+            "password": password,
+        }
+        js = await self._token_request(data)
+
+        tokens = Tokens(
             access_token=js.get("access_token", ""),
             refresh_token=js.get("refresh_token"),
             user_id=str(js.get("user_id")) if js.get("user_id") is not None else None,
         )
+        self._set_expiry(tokens, js.get("expires_in"))
+        return tokens
 
-    async def _auth_headers(self, tokens: Tokens) -> Dict[str, str]:
-        return {"Authorization": f"Bearer {tokens.access_token}", "Accept": "application/json"}
+    def pacing_delay(self, requests: int) -> float:
+        """Seconds `requests` calls may spend queued behind the client-side rate limit."""
+        return self._limiter.queue_time(requests)
 
-    async def get_devices(self, tokens: Tokens) -> List[Dict[str, Any]]:
+    def _auth_headers(self, tokens: Tokens) -> Dict[str, str]:
+        # Rebuilt only when the token changes; aiohttp copies headers per request
+        if self._hdr_cache is None or self._hdr_cache[0] != tokens.access_token:
+            self._hdr_cache = (
+                tokens.access_token,
+                {"Authorization": f"Bearer {tokens.access_token}", "Accept": "application/json"},
+            )
+        return self._hdr_cache[1]
+
+    async def _do_request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        read: Callable[[aiohttp.ClientResponse], Awaitable[_T]],
+        **kwargs: Any,
+    ) -> Tuple[int, Optional[_T]]:
+        """Single request attempt; returns (status, read(resp)), result None on 401/403/404."""
+        await self._limiter.acquire()
+        async with self._session.request(
+            method, url, headers=headers, timeout=DEFAULT_TIMEOUT, **kwargs
+        ) as resp:
+            if resp.status in (401, 403, 404):
+                return resp.status, None
+            if resp.status == 429:
+                self._limiter.record_rate_limit()
+                raise MinutRateLimitError("rate_limited", retry_after=_retry_after(resp))
+            await _raise_for_status(resp)
+            self._limiter.record_success()
+            return resp.status, await read(resp)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        read: Callable[[aiohttp.ClientResponse], Awaitable[_T]],
+        **kwargs: Any,
+    ) -> Tuple[int, Optional[_T]]:
+        """`_do_request`, retrying 429/5xx/dropped connections with jittered backoff."""
+        delay = RETRY_START_DELAY
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            try:
+                return await self._do_request(method, url, headers, read, **kwargs)
+            except MinutRateLimitError as e:
+                # Give up right away if the server wants us gone for longer;
+                # the coordinator backs off its polling instead
+                if attempt == RETRY_ATTEMPTS or (e.retry_after or 0) > RETRY_MAX_DELAY:
+                    raise
+                wait = e.retry_after if e.retry_after is not None else delay
+            except ClientResponseError as e:
+                if e.status < 500 or attempt == RETRY_ATTEMPTS:
+                    raise
+                wait = delay
+            except aiohttp.ClientConnectionError:
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+                wait = delay
+            await asyncio.sleep(min(wait, RETRY_MAX_DELAY) + random.uniform(0, delay))
+            delay *= 2
+        raise AssertionError("unreachable")
+
+    async def _request(
+        self,
+        tokens: Tokens,
+        method: str,
+        url: str,
+        read: Callable[[aiohttp.ClientResponse], Awaitable[_T]],
+        **kwargs: Any,
+    ) -> Optional[_T]:
+        """
+        Authenticated request. Returns `read(resp)`, or None on 404.
+        Transient failures are retried (see `_send`). A 401 is retried once
+        after refreshing the token; 401/403 then raise MinutAuthError, 429
+        MinutRateLimitError and 5xx MinutConnectError.
+        Network errors propagate for the caller to map.
+        """
+        await self._ensure_token(tokens)
+        sent_token = tokens.access_token
         try:
-            async with self._session.get(
-                DRAFT_DEVICES_URL,
-                headers=await self._auth_headers(tokens),
-                timeout=DEFAULT_TIMEOUT,
-            ) as resp:
-                if resp.status in (401, 403):
-                    raise MinutAuthError("invalid_auth")
-                if resp.status == 429:
-                    raise MinutRateLimitError("rate_limited")
-                resp.raise_for_status()
-                js = await resp.json()
-                # Expect list of devices (dashboard shape)
-                return js if isinstance(js, list) else js.get("devices", [])
+            status, result = await self._send(
+                method, url, self._auth_headers(tokens), read, **kwargs
+            )
+            if status == 401 and tokens.refresh_token:
+                async with self._refresh_lock:
+                    # Skip if a concurrent request already refreshed
+                    if tokens.access_token == sent_token:
+                        await self._refresh_access_token(tokens)
+                status, result = await self._send(
+                    method, url, self._auth_headers(tokens), read, **kwargs
+                )
         except ClientResponseError as e:
             if 500 <= e.status < 600:
                 raise MinutConnectError("server_error") from e
             raise
+        if status in (401, 403):
+            raise MinutAuthError("invalid_auth")
+        return result
+
+    async def validate_auth(self, tokens: Tokens) -> None:
+        """
+        Cheap credential check: fetch the user's own record instead of the
+        full device list. Raises MinutAuthError on 401/403. Falls back to
+        listing devices if the user endpoint isn't available (404).
+        """
+        async def ok(resp: aiohttp.ClientResponse) -> bool:
+            return True
+
+        try:
+            found = await self._request(
+                tokens, "GET", DRAFT_USER_URL.format(user_id=tokens.user_id or "me"), ok
+            )
         except (asyncio.TimeoutError, aiohttp.ClientError) as e:
             raise MinutConnectError("cannot_connect") from e
+        if found is None:
+            await self.get_devices(tokens)
+
+    async def get_devices(self, tokens: Tokens) -> List[Dict[str, Any]]:
+        """
+        List the account's devices. The coordinator decides how often to call
+        this (DEVICES_REFRESH_INTERVAL).
+        """
+        try:
+            js = await self._request(tokens, "GET", DRAFT_DEVICES_URL, _read_json)
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise MinutConnectError("cannot_connect") from e
+        # Expect list of devices (dashboard shape)
+        if js is None:
+            devices = []
+        else:
+            devices = js if isinstance(js, list) else js.get("devices", [])
+
+        for device in devices:
+            device_id = device.get("id") or device.get("device_id")
+            if device_id is not None:
+                self._value_urls[str(device_id)] = _value_urls(str(device_id))
+
+        return devices
+
+    def _latest_sample(self, vals: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Pick the newest sample. `limit=1` normally leaves just one; if the
+        server ignores it, learn the ordering once from two adjacent timestamps.
+        """
+        if len(vals) == 1:
+            return vals[0]
+        if self._values_newest_first is None:
+            first, second = _event_time(vals[0]), _event_time(vals[1])
+            if first is None or second is None:
+                return vals[-1]
+            self._values_newest_first = first > second
+        return vals[0] if self._values_newest_first else vals[-1]
 
     async def get_latest_values(self, tokens: Tokens, device_id: str) -> Dict[str, Optional[float]]:
         """
         Try per-sensor endpoints; if missing, return None for that metric.
         """
-        headers = await self._auth_headers(tokens)
         async def fetch_float(url: str) -> Optional[float]:
             try:
-                async with self._session.get(url, headers=headers, timeout=DEFAULT_TIMEOUT) as resp:
-                    if resp.status in (401, 403):
-                        raise MinutAuthError("invalid_auth")
-                    if resp.status == 404:
-                        return None
-                    if resp.status == 429:
-                        raise MinutRateLimitError("rate_limited")
-                    resp.raise_for_status()
-                    js = await resp.json()
-                    # accept [{value: x}] or {values:[{value:x}]}
-                    if isinstance(js, list) and js:
-                        v = js[-1].get("value")
-                        return float(v) if v is not None else None
-                    if isinstance(js, dict):
-                        vals = js.get("values") or js.get("data") or []
-                        if vals:
-                            v = vals[-1].get("value")
-                            return float(v) if v is not None else None
-                    return None
-            except ClientResponseError as e:
-                if 500 <= e.status < 600:
-                    raise MinutConnectError("server_error") from e
-                raise
+                js = await self._request(tokens, "GET", url, _read_json)
             except (asyncio.TimeoutError, aiohttp.ClientError):
                 # Treat network hiccup as missing (coordinator will try again)
                 return None
+            # accept [{value: x}] or {values:[{value:x}]}
+            if isinstance(js, list) and js:
+                v = self._latest_sample(js).get("value")
+                return _as_float(v)
+            if isinstance(js, dict):
+                vals = js.get("values") or js.get("data") or []
+                if vals:
+                    v = self._latest_sample(vals).get("value")
+                    return _as_float(v)
+            return None
 
-        temperature = await fetch_float(DRAFT_TEMP_VALUES_URL.format(device_id=device_id))
-        humidity = await fetch_float(DRAFT_HUMID_VALUES_URL.format(device_id=device_id))
-        noise = await fetch_float(DRAFT_SOUND_AVG_URL.format(device_id=device_id))
+        urls = self._value_urls.get(device_id) or _value_urls(device_id)
+        # The three reads are independent, so overlap them instead of paying 3 RTTs
+        temperature, humidity, noise = await asyncio.gather(*(fetch_float(url) for url in urls))
         return {"temperature": temperature, "humidity": humidity, "noise": noise}
 
-    async def get_recent_events(
-        self, tokens: Tokens, device_id: str, within: timedelta = timedelta(minutes=2)
-    ) -> List[Dict[str, Any]]:
+    async def get_all_recent_events(
+        self, tokens: Tokens, within: timedelta = timedelta(minutes=2)
+    ) -> Dict[str, List[str]]:
         """
-        Pull the latest timeline events and keep those that happened within `within`.
+        Pull the account timeline once and return the types of events that
+        happened within `within`, grouped by device id.
         Events of interest include:
           - activity_detected (motion)
           - alarm_heard, avg_sound_high, sound_level_dropped_normal (noise/alarm)
           - tamper, short_button_press, battery_low, device_online/offline etc.
         """
-        headers = await self._auth_headers(tokens)
-        now = datetime.now(timezone.utc)
+        cutoff = datetime.now(timezone.utc) - within
+
+        async def read_recent(resp: aiohttp.ClientResponse) -> List[Dict[str, Any]]:
+            return _recent_events(await _read_json(resp), cutoff)
 
         try:
-            async with self._session.get(
-                f"{DRAFT_DEVICE_TIMELINE_URL.format(device_id=device_id)}?limit=20",
-                headers=headers,
-                timeout=DEFAULT_TIMEOUT,
-            ) as resp:
-                if resp.status in (401, 403):
-                    raise MinutAuthError("invalid_auth")
-                if resp.status == 429:
-                    raise MinutRateLimitError("rate_limited")
-                if resp.status == 404:
-                    return []
-                resp.raise_for_status()
-                js = await resp.json()
-        except ClientResponseError as e:
-            if 500 <= e.status < 600:
-                raise MinutConnectError("server_error") from e
-            raise
-        except (asyncio.TimeoutError, aiohttp.ClientError):
-            return []
+            recent = await self._request(
+                tokens, "GET", DRAFT_TIMELINE_URL, read_recent, params={"limit": 200}
+            )
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            # Fail the poll rather than report "no events": the coordinator then
+            # backs off and reads the missed span again once it recovers
+            raise MinutConnectError("cannot_connect") from e
+        if recent is None:
+            return {}
 
-        events = js if isinstance(js, list) else js.get("events", [])
-        recent: List[Dict[str, Any]] = []
-        for ev in events:
-            ts = ev.get("timestamp") or ev.get("time") or ev.get("created_at")
-            try:
-                when = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
-            except Exception:
+        events_by_device: Dict[str, List[str]] = {}
+        for ev in recent:
+            device_id = ev.get("device_id") or (ev.get("device") or {}).get("id")
+            event_type = ev.get("type") or ev.get("event_type")
+            if device_id is None or event_type is None:
                 continue
-            if now - when <= within:
-                recent.append(ev)
-        return recent
+            # Ids and types are normally strings already; only convert otherwise
+            key = device_id if type(device_id) is str else str(device_id)
+            events_by_device.setdefault(key, []).append(
+                event_type if type(event_type) is str else str(event_type)
+            )
+        return events_by_device
     
     #test
\ No newline at end of file
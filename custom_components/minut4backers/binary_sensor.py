@@ -9,35 +9,46 @@ interval. When no recent events are found, the sensor resets to ``False``.
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any
 
-from homeassistant.components.binary_sensor import (
-    BinarySensorEntity,
-    BinarySensorDeviceClass,
-)
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, BINARY_SENSOR_EVENTS
-from .coordinator import MinutDataUpdateCoordinator
+from .coordinator import MinutConfigEntry, MinutDataUpdateCoordinator
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: MinutConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Minut binary sensors from a config entry."""
-    coordinator: MinutDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    entities: list[BinarySensorEntity] = []
-    for device_id, data in coordinator.data.items():
-        device = data["device"]
-        for binary_key, config in BINARY_SENSOR_EVENTS.items():
-            entities.append(MinutBinarySensor(coordinator, device_id, device, binary_key, config))
-    async_add_entities(entities)
+    coordinator = entry.runtime_data.coordinator
+    known_ids: set[str] = set()
+
+    @callback
+    def _add_new_devices() -> None:
+        # Also called on every update to pick up devices added to the account
+        new_ids = coordinator.data.keys() - known_ids
+        if not new_ids:
+            return
+        known_ids.update(new_ids)
+        entities: list[BinarySensorEntity] = [
+            MinutBinarySensor(
+                coordinator, device_id, coordinator.data[device_id]["device"], binary_key, config
+            )
+            for device_id in new_ids
+            for binary_key, config in BINARY_SENSOR_EVENTS.items()
+        ]
+        async_add_entities(entities)
+
+    _add_new_devices()
+    entry.async_on_unload(coordinator.async_add_listener(_add_new_devices))
 
 
 class MinutBinarySensor(CoordinatorEntity[MinutDataUpdateCoordinator], BinarySensorEntity):
@@ -59,31 +70,33 @@ class MinutBinarySensor(CoordinatorEntity[MinutDataUpdateCoordinator], BinarySen
         self._binary_key = binary_key
         self._config = config
         self._attr_unique_id = f"{device_id}_{binary_key}"
-        name_prefix = device.get("description") or device.get("name") or f"Point {device_id}"
-        self._attr_name = f"{name_prefix} {binary_key.capitalize()}"
-        # Map the device class string to the corresponding enum if available
-        device_class = config.get("device_class")
-        if device_class:
-            try:
-                self._attr_device_class = BinarySensorDeviceClass(device_class)
-            except ValueError:
-                # Unknown device class; ignore
-                pass
-
-    @property
+        # Home Assistant prepends the device name (has_entity_name)
+        self._attr_name = config["name"]
+        # Resolved from the device class string in const.py; None if unknown
+        self._attr_device_class = config["device_class_enum"]
+        self._update_from_coordinator()
+
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return the device information for registry."""
         return DeviceInfo(
             identifiers={(DOMAIN, str(self._device_id))},
-            name=self._device.get("description") or self._device.get("name"),
+            name=(
+                self._device.get("description")
+                or self._device.get("name")
+                or f"Point {self._device_id}"
+            ),
             manufacturer="Minut",
             model=self._device.get("model") or "Point",
         )
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return the binary sensor state based on recent events."""
+    def _update_from_coordinator(self) -> None:
+        """Cache the state derived from recent events in the coordinator data."""
         data = self.coordinator.data.get(self._device_id)
-        if not data:
-            return None
-        return data["binary"].get(self._binary_key)
\ No newline at end of file
+        self._attr_is_on = data["binary"].get(self._binary_key) if data else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Store the new state once per poll instead of looking it up on every read."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
@@ -6,9 +6,16 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers import aiohttp_client
 
-from .const import DOMAIN
+from . import async_get_session
+from .const import (
+    CONF_ACCESS_TOKEN,
+    CONF_PASSWORD,
+    CONF_REFRESH_TOKEN,
+    CONF_USER_ID,
+    CONF_USERNAME,
+    DOMAIN,
+)
 from .api import (
     MinutAPI,
     MinutAuthError,
@@ -19,6 +26,10 @@ from .api import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Either all token fields or both credential fields must be filled in
+_TOKEN_KEYS = (CONF_USER_ID, CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN)
+_CRED_KEYS = (CONF_USERNAME, CONF_PASSWORD)
+
 DATA_SCHEMA = vol.Schema(
     {
         vol.Optional("username"): str,
@@ -39,23 +50,20 @@ class MinutHacsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is None:
             return self.async_show_form(step_id="user", data_schema=DATA_SCHEMA, errors=errors)
 
-        has_tokens = all(user_input.get(k) for k in ("user_id", "access_token", "refresh_token"))
-        has_creds = all(user_input.get(k) for k in ("username", "password"))
+        has_tokens = all(user_input.get(k) for k in _TOKEN_KEYS)
+        has_creds = all(user_input.get(k) for k in _CRED_KEYS)
 
         if not (has_tokens or has_creds):
             errors["base"] = "missing_auth"
             return self.async_show_form(step_id="user", data_schema=DATA_SCHEMA, errors=errors)
 
-        # ✅ correct way to get the session
-        session = aiohttp_client.async_get_clientsession(self.hass)
-        api = MinutAPI(session)
+        # Reuse the integration's pooled session; MinutAPI itself is a thin
+        # per-account wrapper around it
+        api = MinutAPI(async_get_session(self.hass))
 
         try:
             if has_creds:
                 tokens = await api.password_login(user_input["username"], user_input["password"])
-                user_input["user_id"] = tokens.user_id
-                user_input["access_token"] = tokens.access_token
-                user_input["refresh_token"] = tokens.refresh_token
             else:
                 tokens = Tokens(
                     access_token=user_input["access_token"],
@@ -63,8 +71,14 @@ class MinutHacsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     user_id=user_input.get("user_id"),
                 )
 
-            # Validate tokens/creds: list devices
-            await api.get_devices(tokens)
+            # Validate tokens/creds with a lightweight authenticated call
+            await api.validate_auth(tokens)
+
+            # Store the tokens as they are now: validation may have refreshed
+            # (and rotated) them, revoking the ones that were entered
+            user_input["user_id"] = tokens.user_id
+            user_input["access_token"] = tokens.access_token
+            user_input["refresh_token"] = tokens.refresh_token
 
         except MinutAuthError:
             errors["base"] = "invalid_auth"
@@ -5,6 +5,14 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import Final
 
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import PERCENTAGE, UnitOfSoundPressure, UnitOfTemperature
+
 DOMAIN: Final = "minut4backers"
 
 # Supported platforms. Sensors and binary sensors are implemented.
@@ -14,7 +22,35 @@ PLATFORMS: Final = ["sensor", "binary_sensor"]
 # hour in the official integration, but the API used here allows more frequent
 # polling. A 60 second interval offers near‑real‑time values without risking
 # hitting the documented rate limits【309709768529123†L230-L263】.
-SCAN_INTERVAL: Final = timedelta(seconds=15)
+SCAN_INTERVAL: Final = timedelta(seconds=60)
+
+# How long the coordinator keeps its device list before asking for it again,
+# so newly added Points get entities without a restart. Renames still need a
+# reload of the integration.
+DEVICES_REFRESH_INTERVAL: Final = timedelta(minutes=10)
+
+# Timeline events this recent count as "current". Once a poll has succeeded,
+# the next one asks for everything since that poll started instead, so events
+# aren't missed when the interval grows past this window.
+RECENT_EVENTS_WINDOW: Final = timedelta(minutes=2)
+
+# Maximum number of devices polled concurrently during a single update. Each
+# device issues a handful of requests, so this keeps bursts against the Minut
+# API bounded on accounts with many Points.
+MAX_PARALLEL_DEVICES: Final = 10
+
+# Adaptive polling. After rate limiting or connection errors the interval is
+# doubled (with jitter so instances don't retry in lockstep) up to
+# MAX_BACKOFF_INTERVAL. When a motion or alarm sensor turns on, the next poll
+# comes sooner (once) to pick up follow-up events.
+MAX_BACKOFF_INTERVAL: Final = timedelta(minutes=10)
+FAST_POLL_INTERVAL: Final = timedelta(seconds=20)
+# When IDLE_POLLS_BEFORE_SLOWDOWN polls in a row return identical data the
+# interval keeps doubling up to MAX_IDLE_INTERVAL; any change resets it. Events
+# from the whole gap between polls are still picked up (see
+# RECENT_EVENTS_WINDOW).
+IDLE_POLLS_BEFORE_SLOWDOWN: Final = 3
+MAX_IDLE_INTERVAL: Final = timedelta(minutes=5)
 
 # Configuration keys used in the config flow and stored in the config entry
 CONF_USER_ID: Final = "user_id"
@@ -23,38 +59,67 @@ CONF_REFRESH_TOKEN: Final = "refresh_token"
 CONF_USERNAME: Final = "username"
 CONF_PASSWORD: Final = "password"
 
-SENSOR_TYPES: Final = {
-    "temperature": {
-        "name": "Temperature",
-        "unit": "°C",
-        "device_class": "temperature",
-        "state_class": "measurement",
-    },
-    "humidity": {
-        "name": "Humidity",
-        "unit": "%",
-        "device_class": "humidity",
-        "state_class": "measurement",
-    },
-    "noise": {
-        "name": "Noise Level",
-        "unit": "dBA",
-        "device_class": None,
-        "state_class": "measurement",
-    },
+# Sensors created for each device, keyed by the coordinator's sensor value key.
+# Built once at import and shared by all sensor entities.
+SENSOR_DESCRIPTIONS: Final[dict[str, SensorEntityDescription]] = {
+    "temperature": SensorEntityDescription(
+        key="temperature",
+        name="Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "humidity": SensorEntityDescription(
+        key="humidity",
+        name="Humidity",
+        device_class=SensorDeviceClass.HUMIDITY,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "noise": SensorEntityDescription(
+        key="noise",
+        name="Noise Level",
+        native_unit_of_measurement=UnitOfSoundPressure.WEIGHTED_DECIBEL_A,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
 }
 
 # Binary sensor mapping for timeline events. Each key corresponds to the binary
-# sensor name in Home Assistant and maps to a list of event types that should
+# sensor name in Home Assistant and maps to the set of event types that should
 # trigger the sensor. When an event occurs, the binary sensor will be set to on
 # for a short period before clearing.
 BINARY_SENSOR_EVENTS: Final = {
     "motion": {
-        "event_types": ["activity_detected"],
+        "name": "Motion",
+        "event_types": frozenset({"activity_detected"}),
         "device_class": "motion",
     },
     "alarm": {
-        "event_types": ["alarm_heard", "avg_sound_high", "sound_level_dropped_normal"],
+        "name": "Alarm",
+        "event_types": frozenset(
+            {"alarm_heard", "avg_sound_high", "sound_level_dropped_normal"}
+        ),
         "device_class": "sound",
     },
-}
\ No newline at end of file
+}
+
+# Binary sensor keys as a flat tuple for the per-poll state reset
+BINARY_SENSOR_KEYS: Final = tuple(BINARY_SENSOR_EVENTS)
+
+# Resolve device classes once at import instead of per entity; unknown
+# classes map to None.
+for _config in BINARY_SENSOR_EVENTS.values():
+    _config["device_class_enum"] = BinarySensorDeviceClass.__members__.get(
+        (_config.get("device_class") or "").upper()
+    )
+del _config
+
+# Inverse of BINARY_SENSOR_EVENTS: raw event type -> binary sensor keys it
+# triggers. Lets the coordinator classify events with one dict lookup each.
+EVENT_TYPE_TO_BINARY_KEYS: Final[dict[str, tuple[str, ...]]] = {
+    event_type: tuple(
+        key for key, cfg in BINARY_SENSOR_EVENTS.items() if event_type in cfg["event_types"]
+    )
+    for config in BINARY_SENSOR_EVENTS.values()
+    for event_type in config["event_types"]
+}
@@ -9,15 +9,39 @@ entity platforms.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
-from typing import Any, Dict, Mapping
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Mapping, Optional, TypeAlias
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import MinutAPI
-from .const import SENSOR_TYPES, BINARY_SENSOR_EVENTS
+from .api import (
+    DEFAULT_TIMEOUT,
+    MinutAPI,
+    MinutAuthError,
+    MinutConnectError,
+    MinutRateLimitError,
+    Tokens,
+)
+from .const import (
+    BINARY_SENSOR_KEYS,
+    CONF_ACCESS_TOKEN,
+    CONF_REFRESH_TOKEN,
+    DEVICES_REFRESH_INTERVAL,
+    EVENT_TYPE_TO_BINARY_KEYS,
+    FAST_POLL_INTERVAL,
+    IDLE_POLLS_BEFORE_SLOWDOWN,
+    MAX_BACKOFF_INTERVAL,
+    MAX_IDLE_INTERVAL,
+    MAX_PARALLEL_DEVICES,
+    RECENT_EVENTS_WINDOW,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,55 +50,195 @@ _LOGGER = logging.getLogger(__name__)
 class MinutDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     """Coordinator to manage data fetching for Minut."""
 
-    def __init__(self, hass: HomeAssistant, api: MinutAPI, scan_interval: timedelta) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: MinutConfigEntry,
+        api: MinutAPI,
+        tokens: Tokens,
+        scan_interval: timedelta,
+    ) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name="Minut HACS data coordinator",
             update_interval=scan_interval,
         )
+        self._entry = entry
         self.api = api
-        self._devices: list[Mapping[str, Any]] | None = None
+        self.tokens = tokens
+        self._base_interval = scan_interval
+        self._idle_polls = 0
+        # Normalised (device_id, device) pairs, rebuilt whenever the list is reloaded
+        self._device_index: list[tuple[str, Mapping[str, Any]]] | None = None
+        self._devices_fetched_at: float = 0.0
+        # Start of the last successful poll; the next one reads events back to
+        # here so nothing falls between two polls however far apart they are
+        self._events_since: datetime | None = None
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from Minut.
 
         This method is called by the DataUpdateCoordinator at each polling
-        interval. It gathers the latest sensor values and recent events for
-        each device. If any call fails, an UpdateFailed exception is raised
+        interval. It fetches recent events for the whole account in one call
+        and the latest sensor values for each device. Devices are polled
+        concurrently (bounded by ``MAX_PARALLEL_DEVICES``) since the work is
+        dominated by network round trips, and each stage must finish within
+        80% of the configured polling interval plus the time the rate limiter
+        makes it wait. If any call fails, an UpdateFailed exception is raised
         which will be logged by Home Assistant.
         """
+        started = dt_util.utcnow()
         try:
-            # Fetch the device list once. Devices rarely change and this reduces API calls.
-            if self._devices is None:
-                self._devices = await self.api.get_devices()
-                _LOGGER.debug("Loaded %s devices from Minut", len(self._devices))
-
-            devices_data: Dict[str, Any] = {}
-            # Fetch latest events across all devices once per update
-            events_by_device = await self.api.get_recent_events()
-
-            # Iterate through each device and fetch sensor values
-            for device in self._devices:
-                device_id = str(device.get("id") or device.get("device_id"))
-                if not device_id:
-                    continue
-                sensors: Dict[str, Any] = {}
-                for key in SENSOR_TYPES:
-                    value = await self.api.get_latest_sensor_value(device_id, key)
-                    sensors[key] = value
-                # Derive binary sensor states from events
-                device_events = events_by_device.get(device_id, [])
-                binary_states: Dict[str, bool] = {}
-                for binary_key, config in BINARY_SENSOR_EVENTS.items():
-                    # Set state to True if any matching event occurred recently
-                    state = any(evt in device_events for evt in config["event_types"])
-                    binary_states[binary_key] = state
-                devices_data[device_id] = {
-                    "device": device,
-                    "sensors": sensors,
-                    "binary": binary_states,
-                }
-            return devices_data
+            # Don't let a stuck request stall the loop indefinitely
+            async with asyncio.timeout(self._deadline(1)):
+                devices = await self._refresh_devices()
+            # One timeline call plus three value reads per device
+            async with asyncio.timeout(self._deadline(1 + 3 * len(devices))):
+                events_by_device, results = await self._fetch(devices)
+        except MinutAuthError as err:
+            raise UpdateFailed("Authentication with Minut API failed") from err
+        except (MinutRateLimitError, MinutConnectError, asyncio.TimeoutError) as err:
+            self._back_off(getattr(err, "retry_after", None))
+            raise UpdateFailed(f"Error fetching data from Minut API: {err!r}") from err
         except Exception as err:
-            raise UpdateFailed(f"Error fetching data from Minut API: {err}") from err
\ No newline at end of file
+            raise UpdateFailed(f"Error fetching data from Minut API: {err}") from err
+        finally:
+            # A refresh may have happened even if a later request failed
+            self._persist_tokens()
+        self._events_since = started
+
+        previous = self.data or {}
+        # A motion/alarm sensor that wasn't on at the last poll
+        new_activity = False
+        devices_data: Dict[str, Any] = {}
+        for (device_id, device), sensors in zip(devices, results):
+            # Derive binary sensor states from events: a sensor is on if any
+            # matching event occurred recently
+            binary_states: Dict[str, bool] = dict.fromkeys(BINARY_SENSOR_KEYS, False)
+            for event_type in events_by_device.get(device_id, []):
+                for binary_key in EVENT_TYPE_TO_BINARY_KEYS.get(event_type, ()):
+                    binary_states[binary_key] = True
+            if not new_activity and any(binary_states.values()):
+                was_on = previous.get(device_id, {}).get("binary", {})
+                new_activity = any(on and not was_on.get(key) for key, on in binary_states.items())
+            devices_data[device_id] = {
+                "device": device,
+                "sensors": sensors,
+                "binary": binary_states,
+            }
+
+        if new_activity:
+            # Motion or an alarm just started; check once more soon for
+            # follow-up events. Other event types don't speed up polling.
+            self._idle_polls = 0
+            self.update_interval = min(self._base_interval, FAST_POLL_INTERVAL)
+        elif devices_data == self.data:
+            self._idle_polls += 1
+            if self._idle_polls >= IDLE_POLLS_BEFORE_SLOWDOWN:
+                # Nothing changed for a while; poll less often
+                current = self.update_interval or self._base_interval
+                self.update_interval = min(MAX_IDLE_INTERVAL, current * 2)
+            else:
+                self.update_interval = self._jittered_base_interval()
+        else:
+            self._idle_polls = 0
+            self.update_interval = self._jittered_base_interval()
+        return devices_data
+
+    def _deadline(self, requests: int) -> float:
+        """Seconds a stage sending `requests` requests may take before it's abandoned."""
+        # Sized from the configured interval, not the current one: a 20 s fast
+        # poll would leave less time than a single request may take. Queueing
+        # for the rate limiter comes on top, so large accounts (or a limiter
+        # slowed down by 429s) don't time out on every poll.
+        budget = max(self._base_interval.total_seconds() * 0.8, DEFAULT_TIMEOUT.total)
+        return budget + self.api.pacing_delay(requests)
+
+    def _persist_tokens(self) -> None:
+        """Write refreshed (possibly rotated) tokens back to the config entry.
+
+        The API refreshes ``self.tokens`` in place; without this a restart
+        would start from the original, by then revoked, refresh token.
+        """
+        data = self._entry.data
+        if (
+            data.get(CONF_ACCESS_TOKEN) == self.tokens.access_token
+            and data.get(CONF_REFRESH_TOKEN) == self.tokens.refresh_token
+        ):
+            return
+        self.hass.config_entries.async_update_entry(
+            self._entry,
+            data={
+                **data,
+                CONF_ACCESS_TOKEN: self.tokens.access_token,
+                CONF_REFRESH_TOKEN: self.tokens.refresh_token,
+            },
+        )
+
+    def _jittered_base_interval(self) -> timedelta:
+        """Configured interval plus a little jitter so instances drift apart."""
+        return self._base_interval + timedelta(seconds=random.uniform(0, 2))
+
+    async def _refresh_devices(self) -> list[tuple[str, Mapping[str, Any]]]:
+        """Return the device index, reloading it when it is due."""
+        # Devices rarely change, so only reload the list every
+        # DEVICES_REFRESH_INTERVAL instead of on every poll.
+        now = self.hass.loop.time()
+        if (
+            self._device_index is None
+            or now - self._devices_fetched_at > DEVICES_REFRESH_INTERVAL.total_seconds()
+        ):
+            raw_devices = await self.api.get_devices(self.tokens)
+            self._device_index = [
+                (str(d.get("id") or d.get("device_id")), d)
+                for d in raw_devices
+                if d.get("id") or d.get("device_id")
+            ]
+            self._devices_fetched_at = now
+            _LOGGER.debug("Loaded %s devices from Minut", len(self._device_index))
+        return self._device_index
+
+    async def _fetch(
+        self, devices: list[tuple[str, Mapping[str, Any]]]
+    ) -> tuple[Dict[str, list[str]], list[Dict[str, Optional[float]]]]:
+        """Fetch recent events and per-device sensor values."""
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_DEVICES)
+
+        async def fetch_device(device_id: str) -> Dict[str, Optional[float]]:
+            async with semaphore:
+                return await self.api.get_latest_values(self.tokens, device_id)
+
+        within = RECENT_EVENTS_WINDOW
+        if self._events_since is not None:
+            within = max(within, dt_util.utcnow() - self._events_since)
+
+        # The account-wide events call is independent of the sensor reads, so
+        # run it alongside them rather than before
+        events_by_device, *results = await asyncio.gather(
+            self.api.get_all_recent_events(self.tokens, within),
+            *(fetch_device(device_id) for device_id, _ in devices),
+        )
+        return events_by_device, results
+
+    def _back_off(self, retry_after: float | None = None) -> None:
+        """Double the polling interval (capped, jittered) after a failed poll.
+
+        A Retry-After from the server is honoured even beyond the cap. Events
+        from the outage aren't lost: the event cutoff only moves on success.
+        """
+        current = self.update_interval or self._base_interval
+        seconds = min(MAX_BACKOFF_INTERVAL.total_seconds(), current.total_seconds() * 2)
+        seconds = max(seconds, retry_after or 0)
+        self.update_interval = timedelta(seconds=seconds + random.uniform(0, 5))
+
+
+@dataclass(slots=True)
+class MinutRuntimeData:
+    """Per-entry objects shared with the platforms via ``entry.runtime_data``."""
+
+    coordinator: MinutDataUpdateCoordinator
+    api: MinutAPI
+
+
+MinutConfigEntry: TypeAlias = ConfigEntry[MinutRuntimeData]
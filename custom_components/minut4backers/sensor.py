@@ -6,34 +6,45 @@ device. Sensors are derived from the data provided by the coordinator.
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from functools import cached_property
+from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature, PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SENSOR_TYPES
-from .coordinator import MinutDataUpdateCoordinator
+from .const import DOMAIN, SENSOR_DESCRIPTIONS
+from .coordinator import MinutConfigEntry, MinutDataUpdateCoordinator
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: MinutConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Minut sensors from a config entry."""
-    coordinator: MinutDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    entities: list[SensorEntity] = []
-    # Create an entity for each device and sensor type
-    for device_id, data in coordinator.data.items():
-        device = data["device"]
-        for sensor_key, info in SENSOR_TYPES.items():
-            entities.append(MinutSensor(coordinator, device_id, device, sensor_key, info))
-    async_add_entities(entities)
+    coordinator = entry.runtime_data.coordinator
+    known_ids: set[str] = set()
+
+    @callback
+    def _add_new_devices() -> None:
+        # Create an entity for each device and sensor type, including devices
+        # that first show up when the coordinator reloads the device list
+        new_ids = coordinator.data.keys() - known_ids
+        if not new_ids:
+            return
+        known_ids.update(new_ids)
+        entities: list[SensorEntity] = [
+            MinutSensor(coordinator, device_id, coordinator.data[device_id]["device"], description)
+            for device_id in new_ids
+            for description in SENSOR_DESCRIPTIONS.values()
+        ]
+        async_add_entities(entities)
+
+    _add_new_devices()
+    entry.async_on_unload(coordinator.async_add_listener(_add_new_devices))
 
 
 class MinutSensor(CoordinatorEntity[MinutDataUpdateCoordinator], SensorEntity):
@@ -46,45 +57,38 @@ class MinutSensor(CoordinatorEntity[MinutDataUpdateCoordinator], SensorEntity):
         coordinator: MinutDataUpdateCoordinator,
         device_id: str,
         device: dict[str, Any],
-        sensor_key: str,
-        sensor_info: dict[str, Any],
+        description: SensorEntityDescription,
     ) -> None:
         super().__init__(coordinator)
         self._device_id = device_id
         self._device = device
-        self._sensor_key = sensor_key
-        self._sensor_info = sensor_info
-        self._attr_unique_id = f"{device_id}_{sensor_key}"
-        name_prefix = device.get("description") or device.get("name") or f"Point {device_id}"
-        self._attr_name = f"{name_prefix} {sensor_info['name']}"
-        # Set unit, device class, state class
-        self._attr_unit_of_measurement = sensor_info["unit"]
-        device_class = sensor_info.get("device_class")
-        if device_class == "temperature":
-            self._attr_device_class = SensorDeviceClass.TEMPERATURE
-            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        elif device_class == "humidity":
-            self._attr_device_class = SensorDeviceClass.HUMIDITY
-            self._attr_native_unit_of_measurement = PERCENTAGE
-        elif device_class:
-            # Generic or None; set as string to allow unknown types
-            self._attr_device_class = SensorDeviceClass(device_class)
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
+        # Name, unit, device class and state class come from the description;
+        # the device name is prepended by Home Assistant (has_entity_name)
+        self.entity_description = description
+        self._attr_unique_id = f"{device_id}_{description.key}"
+        self._update_from_coordinator()
+
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return the device information for registry."""
         return DeviceInfo(
             identifiers={(DOMAIN, str(self._device_id))},
-            name=self._device.get("description") or self._device.get("name"),
+            name=(
+                self._device.get("description")
+                or self._device.get("name")
+                or f"Point {self._device_id}"
+            ),
             manufacturer="Minut",
             model=self._device.get("model") or "Point",
         )
 
-    @property
-    def native_value(self) -> Any:
-        """Return the current sensor value."""
+    def _update_from_coordinator(self) -> None:
+        """Cache the current value from the coordinator data."""
         data = self.coordinator.data.get(self._device_id)
-        if not data:
-            return None
-        return data["sensors"].get(self._sensor_key)
\ No newline at end of file
+        self._attr_native_value = data["sensors"].get(self.entity_description.key) if data else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Store the new value once per poll instead of looking it up on every read."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()